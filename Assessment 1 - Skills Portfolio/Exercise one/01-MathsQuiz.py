@@ -1,17 +1,28 @@
 # Exercise 1 - Space Math Adventure Quiz
 # This is my math quiz game with different difficulty levels
 # I used tkinter for the GUI and PIL for images
+# PIL works with normal Pillow, but pillow-simd is a drop-in replacement that
+# resizes images a lot faster (pip uninstall pillow && pip install pillow-simd)
 
 import tkinter as tk
-from tkinter import messagebox
-from PIL import Image, ImageTk
+import tkinter.font as tkfont
+from PIL import Image, ImageChops, ImageTk
 import random
+import bisect
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import os
 from enum import Enum
 import math
+import time
 
-from config.animations import AnimationManager, ScreenManager
+from config.animations import (
+    AnimationManager, ScreenManager, drop_prefetched_animations, prefetch_animation
+)
 from config.settings import *
-from utils.helpers import MathHelper, PowerUpManager
+from utils.helpers import (
+    OPERATOR_FUNCTIONS, MathHelper, PowerUpManager, fit_within, sized_asset_path
+)
 
 # Color scheme for the game - wanted it to look space themed
 # spent way too long picking these colors lol
@@ -28,70 +39,155 @@ SUCCESS_COLOR = "#00E676"
 WARNING_COLOR = "#FFB703"
 ERROR_COLOR = "#FF4C60"
 INFO_COLOR = "#4FC3F7"
+TEXT_COLOR = "#FFFFFF"
+TITLE_GOLD = "#FFD700"
+HUD_BG = "#0A2A43"  # behind the timer and score
+BOOST_PINK = "#FF5AA5"  # double points messages
+
+# each operation symbol maps to the function that works out the answer
+# (OPERATOR_FUNCTIONS in utils.helpers) so theres no if/elif chain when checking answers
+# Added multiplication to make it more interesting
+# weights make addition/subtraction more common than multiplication
+OPERATION_SYMBOLS = ('+', '-', '*')
+# stored as running totals so random doesnt have to add them up on every pick
+OPERATION_CUM_WEIGHTS = (40, 80, 100)  # 40% add, 40% subtract, 20% multiply
+
+
+# Opens, resizes and cleans up an image - cached so the same button image
+# (like the back button) only gets decoded and resized once
+# remove_color has to be a tuple here so it can be used as a cache key
+# bilinear is plenty for small button icons and much cheaper than lanczos
+@functools.lru_cache(maxsize=64)
+def load_resized_image(path, max_width, max_height, remove_color=None, resample=Image.BILINEAR):
+    """Return a resized PIL image, reusing earlier results for the same arguments"""
+    # use the pre-resized copy from utils/prepare_assets.py if there is one
+    sized_path = sized_asset_path(path, max_width, max_height)
+    if os.path.exists(sized_path):
+        path = sized_path
+    original = Image.open(path)
+    if remove_color is not None:
+        # removing a color needs an alpha channel to write into
+        original = original.convert("RGBA")
+    elif original.mode not in ("RGB", "RGBA"):
+        # only keep alpha if the image actually has transparency
+        keep_alpha = original.mode in ("LA", "PA") or "transparency" in original.info
+        original = original.convert("RGBA" if keep_alpha else "RGB")
+    # Calculate aspect ratio preserving dimensions
+    new_size = fit_within(original.width, original.height, max_width, max_height)
+
+    # no need to resample if the image is already the right size
+    if original.size == new_size:
+        original.load()  # read the pixels now so the cached image doesnt keep the file open
+        resized = original
+    else:
+        resized = original.resize(new_size, resample)
+
+    # This part removes black backgrounds from icons
+    # was annoying having black boxes around my rocket and exit buttons
+    if remove_color is not None:
+        red, green, blue, alpha = resized.split()
+        # each band becomes 255 where it matches the color we want to remove
+        # (point builds a lookup table so this runs in PIL's C code, not a python loop)
+        matches = [
+            band.point(lambda value, wanted=wanted: 255 if value == wanted else 0)
+            for band, wanted in zip((red, green, blue), remove_color)
+        ]
+        # only pixels where all three channels match end up as 255
+        mask = ImageChops.multiply(ImageChops.multiply(matches[0], matches[1]), matches[2])
+        # subtracting the mask clamps matching pixels to fully transparent
+        resized.putalpha(ImageChops.subtract(alpha, mask))
+
+    return resized
+
+
+# Placeholder images for when loading fails, one per size
+# so lots of missing images dont each make their own copy
+FALLBACK_IMAGES = {}
+# PhotoImages we already made, keyed by the load_image_with_aspect arguments
+# keeping them in here also stops tk from garbage collecting them
+PHOTO_IMAGES = {}
 
 
 # This function loads images and makes sure they dont get stretched weird
 # had to look up how to preserve aspect ratio cause my images were getting squished
-def load_image_with_aspect(path, max_width, max_height, remove_color=None):
+def load_image_with_aspect(path, max_width, max_height, remove_color=None, resample=Image.BILINEAR):
     """Load image preserving aspect ratio"""
     try:
-        original = Image.open(path).convert("RGBA")
-        # Calculate aspect ratio preserving dimensions
-        # basically checking if image is wider or taller than what we want
-        original_ratio = original.width / original.height
-        target_ratio = max_width / max_height
-        
-        if original_ratio > target_ratio:
-            # Image is wider
-            new_width = max_width
-            new_height = int(max_width / original_ratio)
-        else:
-            # Image is taller
-            new_height = max_height
-            new_width = int(max_height * original_ratio)
-        
-        resized = original.resize((new_width, new_height), Image.LANCZOS)
-
-        # This part removes black backgrounds from icons
-        # was annoying having black boxes around my rocket and exit buttons
         if remove_color is not None:
-            data = resized.getdata()
-            cleaned = []
-            target = tuple(remove_color)
-            for pixel in data:
-                # if pixel matches the color we want to remove, make it transparent
-                if pixel[:3] == target:
-                    cleaned.append((pixel[0], pixel[1], pixel[2], 0))
-                else:
-                    cleaned.append(pixel)
-            resized.putdata(cleaned)
-
-        return ImageTk.PhotoImage(resized)
+            remove_color = tuple(remove_color)
+        key = (path, max_width, max_height, remove_color, resample)
+        photo = PHOTO_IMAGES.get(key)
+        if photo is None:
+            # PhotoImage needs the Tk window to exist so it gets made here, not in the lru_cache
+            resized = load_resized_image(path, max_width, max_height, remove_color, resample)
+            photo = PHOTO_IMAGES[key] = ImageTk.PhotoImage(resized)
+        return photo
     except Exception as e:
         print(f"Error loading image {path}: {e}")
-        # Create fallback image
-        fallback = Image.new('RGBA', (max_width, max_height), color='#2C3E50')
-        return ImageTk.PhotoImage(fallback)
+        # Create fallback image (or reuse the one we already made for this size)
+        key = (max_width, max_height)
+        fallback = FALLBACK_IMAGES.get(key)
+        if fallback is None:
+            fallback = ImageTk.PhotoImage(Image.new('RGBA', key, color='#2C3E50'))
+            FALLBACK_IMAGES[key] = fallback
+        return fallback
+
+
+# Decodes and resizes several images at the same time using threads
+# PIL does the heavy lifting in C and lets go of the GIL, so the threads really overlap
+# the PhotoImage part still has to happen on the main thread (tkinter isnt thread safe)
+def preload_images(image_specs):
+    """Fill the load_resized_image cache for (path, width, height, remove_color) specs"""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for path, max_width, max_height, remove_color in image_specs:
+            # same positional arguments as load_image_with_aspect so the cache keys match
+            pool.submit(load_resized_image, path, max_width, max_height, remove_color, Image.BILINEAR)
+    # any errors get reported later when load_image_with_aspect tries again
+
+
+feedback_color = TEXT_COLOR  # color the feedback label is showing right now
 
 
 # Helper function to show messages to the player
 # makes it easier to give feedback without repeating code everywhere
-def show_feedback(message, color="#FFFFFF", duration=1500):
+def show_feedback(message, color=TEXT_COLOR, duration=1500):
     """Display smooth feedback messages in a consistent style."""
-    if 'result_display' not in globals():
-        return
-    result_display.config(text=message, fg=color)
+    # only ever called from game events, so result_display always exists by then
+    global feedback_color
+    result_var.set(message)
+    # most messages reuse the last color, so only send it to tk when it changes
+    if color != feedback_color:
+        feedback_color = color
+        result_display.config(fg=color)
+    # cancel the clear from an older message so it cant wipe this one early
+    if Game.feedback_after_id:
+        main_window.after_cancel(Game.feedback_after_id)
     # auto clear the message after a bit so it doesnt stay forever
-    if duration:
-        main_window.after(duration, lambda: result_display.config(text=""))
+    Game.feedback_after_id = main_window.after(duration, clear_feedback) if duration else None
+
+
+def clear_feedback():
+    """Blank the feedback message and drop any clear that is still waiting"""
+    if Game.feedback_after_id:
+        main_window.after_cancel(Game.feedback_after_id)
+        Game.feedback_after_id = None
+    if result_var.get():  # already blank most of the time, no need to tell tk again
+        result_var.set("")
 
 
 # Changes the input box color based on state
 # red when theres an error, normal blue otherwise
+input_in_error = False  # the answer box starts out with the normal colors
+
+
 def set_input_state(state="normal"):
     """Tint the answer box to reflect its current status."""
-    if 'input_container' not in globals() or 'answer_input' not in globals():
+    global input_in_error
+    # nothing to do if the box is already showing this state
+    # (this gets called on every key press so it saves a lot of config calls)
+    if (state == "error") == input_in_error:
         return
+    input_in_error = state == "error"
 
     if state == "error":
         # turn red when user enters invalid stuff
@@ -102,6 +198,10 @@ def set_input_state(state="normal"):
         input_container.config(bg=INPUT_BG, highlightbackground=ACCENT_CYAN)
         answer_input.config(bg=ENTRY_BG, fg=ENTRY_TEXT_COLOR)
 
+# Best possible score - 15 points for every challenge solved first try
+MAX_SCORE = 15 * MAX_CHALLENGES
+
+
 # === Game Difficulty Levels ===
 # Using Enum cause it makes it easier to manage the different levels
 # each level has: id, color, background image, min number, max number
@@ -111,25 +211,14 @@ class GameLevel(Enum):
     EXPLORER = (1, "#344955", PLANET_BG_PATH, 10, 50)   # Medium range
     MASTER = (2, "#232F34", GALAXY_BG_PATH, 50, 200)    # Complex challenges
 
-    @property
-    def level_id(self):
-        return self.value[0]
-
-    @property
-    def theme_color(self):
-        return self.value[1]
-
-    @property
-    def background_path(self):
-        return self.value[2]
-
-    @property
-    def min_value(self):
-        return self.value[3]
-
-    @property
-    def max_value(self):
-        return self.value[4]
+    # Enum passes each tuple above into __init__, so the parts get saved as
+    # normal attributes once instead of indexing self.value on every access
+    def __init__(self, level_id, theme_color, background_path, min_value, max_value):
+        self.level_id = level_id
+        self.theme_color = theme_color
+        self.background_path = background_path
+        self.min_value = min_value
+        self.max_value = max_value
 
 
 # === Game State Controller ===
@@ -141,12 +230,17 @@ class GameSession:
         self.current_level = GameLevel.BEGINNER
         self.points = 0
         self.problems_solved = 0
-        self.active_challenge = None  # stores the current math problem
+        self.active_challenge = None  # stores the current math problem (num1, num2, operation, answer)
         self.attempts_made = 0  # how many tries on current problem
-        self.remaining_time = GAME_DURATION
+        self.remaining_time = GAME_DURATION  # seconds currently shown on the timer
+        self.end_time = 0  # time.monotonic() value when the challenge runs out
         self.timer_reference = None  # need this to cancel timer if needed
-        self.active_powerups = []  # list of active powerups
+        self.expiry_reference = None  # the single after() that fires when time runs out
+        self.timer_color = WARNING_COLOR  # color the timer label is showing right now
+        self.feedback_after_id = None  # pending after() that clears the feedback message
+        self.active_powerups = set()  # names of active powerups
         self.powerup_charges = 3  # how many boosts player has left
+        self.challenges = []  # every (num1, num2, operation, answer) for this game
 
     def initialize_new_game(self, selected_level=GameLevel.BEGINNER):
         """Prepare for a new game session"""
@@ -156,14 +250,45 @@ class GameSession:
         self.active_challenge = None
         self.attempts_made = 0
         self.remaining_time = GAME_DURATION
-        self.active_powerups = []
+        self.end_time = 0
+        self.active_powerups = set()
         self.powerup_charges = 3
 
+        # roll all the challenges for the game in one go (answers included)
+        # so nothing random or branchy happens while the player is actually playing
+        low, high = selected_level.min_value, selected_level.max_value
+        numbers = random.choices(range(low, high + 1), k=2 * MAX_CHALLENGES)
+        operations = random.choices(
+            OPERATION_SYMBOLS, cum_weights=OPERATION_CUM_WEIGHTS, k=MAX_CHALLENGES
+        )
+        self.challenges = []
+        for index, operation in enumerate(operations):
+            num1, num2 = numbers[2 * index], numbers[2 * index + 1]
+            # Make sure subtraction gives positive answers (swap if needed)
+            # and keep multiplication simple for beginners
+            if operation == '-' and num1 < num2:
+                num1, num2 = num2, num1  # swap so we dont get negative answers
+            elif operation == '*' and selected_level == GameLevel.BEGINNER:
+                num2 = random.randint(2, 5)  # smaller numbers for beginners
+            self.challenges.append((num1, num2, operation, OPERATOR_FUNCTIONS[operation](num1, num2)))
+
 
 # Global game session instance
 Game = GameSession()
 
 
+# Performance ratings for the end of the game
+# the score is looked up against the thresholds with bisect instead of a long if/elif
+RATING_THRESHOLDS = (60, 90, 120, 135)
+RATINGS = (
+    ("SPACE CADET 🌠", "The stars await your improvement!"),
+    ("PLANET TRAVELER 🪐", "Good effort! Keep practicing!"),
+    ("SPACE EXPLORER 🌌", "Great problem-solving skills!"),
+    ("GALACTIC SCHOLAR 🚀", "Amazing mathematical journey!"),
+    ("COSMIC GENIUS 🌟", "Your math skills are out of this world!"),
+)
+
+
 # === Core Game Mechanics ===
 class GameEngine:
     """Handles all game logic and mathematical operations"""
@@ -174,40 +299,18 @@ class GameEngine:
         display_screen(level_select_frame)
     
     @staticmethod
-    def generate_number(level: GameLevel):
-        """Create random numbers based on selected level"""
-        return random.randint(level.min_value, level.max_value)
-    
-    @staticmethod
-    def select_operation():
-        """Randomly choose mathematical operation"""
-        # Added multiplication to make it more interesting
-        # weights make addition/subtraction more common than multiplication
-        operations = ['+', '-', '*']
-        weights = [40, 40, 20]  # 40% add, 40% subtract, 20% multiply
-        return random.choices(operations, weights=weights)[0]
-    
-    @staticmethod
-    def present_challenge(level: GameLevel):
+    def present_challenge():
         """Display a new mathematical challenge"""
-        num1 = GameEngine.generate_number(level)
-        num2 = GameEngine.generate_number(level)
-        operation = GameEngine.select_operation()
-
-        # Make sure subtraction gives positive answers (swap if needed)
-        # and keep multiplication simple for beginners
-        if operation == '-' and num1 < num2:
-            num1, num2 = num2, num1  # swap so we dont get negative answers
-        elif operation == '*' and level == GameLevel.BEGINNER:
-            num2 = random.randint(2, 5)  # smaller numbers for beginners
-
-        Game.active_challenge = (num1, num2, operation)
+        # the challenge (and its answer) was already rolled in initialize_new_game
+        Game.active_challenge = Game.challenges[Game.problems_solved]
+        num1, num2, operation, correct = Game.active_challenge
         
         # Update display elements
-        challenge_title.config(text=f"CHALLENGE {Game.problems_solved + 1}/{MAX_CHALLENGES}")
-        problem_display.config(text=f"{num1} {operation} {num2} = ?")
-        result_display.config(text="")
-        answer_input.delete(0, "end")
+        challenge_var.set(f"CHALLENGE {Game.problems_solved + 1}/{MAX_CHALLENGES}")
+        problem_var.set(f"{num1} {operation} {num2} = ?")
+        clear_feedback()
+        if answer_var.get():  # box is empty on the first challenge
+            answer_input.delete(0, "end")
         answer_input.focus()
         Game.attempts_made = 0
         begin_countdown()
@@ -215,15 +318,8 @@ class GameEngine:
         return num1, num2, operation
     
     @staticmethod
-    def verify_solution(num1, num2, operation, player_answer):
+    def verify_solution(correct, player_answer):
         """Check if player's answer is correct"""
-        if operation == '+':
-            correct = num1 + num2
-        elif operation == '-':
-            correct = num1 - num2
-        else:  # multiplication
-            correct = num1 * num2
-            
         is_correct = player_answer == correct
         
         if is_correct:
@@ -248,26 +344,11 @@ class GameEngine:
     def show_final_results():
         """Display end-of-game results and rating"""
         final_score = Game.points
-        maximum_score = 15 * MAX_CHALLENGES
         
         # Determine performance rating
-        if final_score >= 135:
-            rating = "COSMIC GENIUS 🌟"
-            message = "Your math skills are out of this world!"
-        elif final_score >= 120:
-            rating = "GALACTIC SCHOLAR 🚀"
-            message = "Amazing mathematical journey!"
-        elif final_score >= 90:
-            rating = "SPACE EXPLORER 🌌"
-            message = "Great problem-solving skills!"
-        elif final_score >= 60:
-            rating = "PLANET TRAVELER 🪐"
-            message = "Good effort! Keep practicing!"
-        else:
-            rating = "SPACE CADET 🌠"
-            message = "The stars await your improvement!"
+        rating, message = RATINGS[bisect.bisect_right(RATING_THRESHOLDS, final_score)]
         
-        summary = f"FINAL SCORE: {final_score}/{maximum_score}\nRANK: {rating}\n\n{message}\n\nEmbark on another adventure?"
+        summary = f"FINAL SCORE: {final_score}/{MAX_SCORE}\nRANK: {rating}\n\n{message}\n\nEmbark on another adventure?"
         
         return summary, rating
 
@@ -278,20 +359,28 @@ class GameEngine:
 def activate_time_boost():
     """Add extra time to current challenge"""
     if Game.powerup_charges > 0:
-        Game.remaining_time += 15  # add 15 seconds
+        Game.end_time += 15  # add 15 seconds
+        if Game.expiry_reference:
+            schedule_time_up()  # push back the time's up call to match
+        if Game.timer_reference:
+            # show the new time straight away, then restart the label loop
+            # so its next wake-up lines up with the new second boundary
+            show_time_left(max(0, math.ceil(Game.end_time - time.monotonic())))
+            main_window.after_cancel(Game.timer_reference)
+            Game.timer_reference = main_window.after_idle(update_timer_display)
         Game.powerup_charges -= 1
-        powerup_indicator.config(text=f"BOOSTS: {Game.powerup_charges}")
+        powerup_var.set(f"BOOSTS: {Game.powerup_charges}")
         show_feedback("+15 SECONDS! ⏰", INFO_COLOR, duration=1000)
     else:
         show_feedback("NO BOOSTS REMAINING! 😔", ERROR_COLOR)
 
 def activate_double_points():
     """Double points for next correct answer"""
-    if Game.powerup_charges > 0 and not any('double' in p for p in Game.active_powerups):
-        Game.active_powerups.append('double_points')
+    if Game.powerup_charges > 0 and 'double_points' not in Game.active_powerups:
+        Game.active_powerups.add('double_points')
         Game.powerup_charges -= 1
-        powerup_indicator.config(text=f"BOOSTS: {Game.powerup_charges}")
-        show_feedback("NEXT ANSWER WORTH DOUBLE! 💎", "#FF5AA5")
+        powerup_var.set(f"BOOSTS: {Game.powerup_charges}")
+        show_feedback("NEXT ANSWER WORTH DOUBLE! 💎", BOOST_PINK)
     elif Game.powerup_charges <= 0:
         show_feedback("NO BOOSTS REMAINING! 😔", ERROR_COLOR)
     else:
@@ -306,7 +395,7 @@ def apply_powerup_effects(points):
     if 'double_points' in Game.active_powerups:
         final_points *= 2
         Game.active_powerups.remove('double_points')  # remove after using
-        show_feedback(f"DOUBLE POINTS ACTIVATED! +{final_points} 🎉", "#FF5AA5")
+        show_feedback(f"DOUBLE POINTS ACTIVATED! +{final_points} 🎉", BOOST_PINK)
     
     return final_points
 
@@ -314,46 +403,81 @@ def apply_powerup_effects(points):
 # === Time Management System ===
 def begin_countdown():
     """Initialize challenge timer"""
-    Game.remaining_time = GAME_DURATION
-    update_timer_display()
-
-# Timer countdown - updates every second
+    # remember when time runs out instead of counting down ticks
+    # (after() can fire late so counting ticks made the timer drift)
+    stop_timer()  # make sure nothing from the last countdown is still scheduled
+    Game.end_time = time.monotonic() + GAME_DURATION
+    Game.remaining_time = None  # forces the label to redraw on the first check
+    # one after() for when time actually runs out, plus a separate loop
+    # that only keeps the label up to date
+    schedule_time_up()
+    Game.timer_reference = main_window.after_idle(update_timer_display)
+
+def schedule_time_up():
+    """(Re)arm the after() that calls time_expired when the challenge runs out"""
+    if Game.expiry_reference:
+        main_window.after_cancel(Game.expiry_reference)
+    delay_ms = max(0, int((Game.end_time - time.monotonic()) * 1000))
+    Game.expiry_reference = main_window.after(delay_ms, time_expired)
+
+# Timer label - wakes up right after each whole second goes by
 def update_timer_display():
-    """Update and manage the countdown timer"""
-    if Game.remaining_time >= 0:
-        # turn red when time is running out (less than 8 seconds)
-        timer_indicator.config(
-            text=f"TIME: {Game.remaining_time}s",
-            fg=ERROR_COLOR if Game.remaining_time <= 8 else WARNING_COLOR
-        )
-        Game.remaining_time -= 1
-        # schedule next update in 1 second
-        Game.timer_reference = main_window.after(1000, update_timer_display)
+    """Refresh the countdown label until the time runs out"""
+    time_left = Game.end_time - time.monotonic()
+    show_time_left(max(0, math.ceil(time_left)))
+
+    if time_left > 0:
+        # sleep until the shown number is due to drop (+1ms so we land just past it)
+        # instead of polling, so the label changes once a second and never drifts
+        until_next_second = time_left - math.floor(time_left) or 1.0
+        Game.timer_reference = main_window.after(int(until_next_second * 1000) + 1, update_timer_display)
     else:
-        time_expired()  # time ran out
+        Game.timer_reference = None  # time_expired takes it from here
+
+def show_time_left(seconds_left):
+    """Put the seconds left on the timer label"""
+    # only touch the label when the number shown actually changes
+    if seconds_left == Game.remaining_time:
+        return
+    Game.remaining_time = seconds_left
+    timer_var.set(f"TIME: {seconds_left}s")
+    # turn red when time is running out (less than 8 seconds)
+    # only send the color to tk when it actually switches
+    color = ERROR_COLOR if seconds_left <= 8 else WARNING_COLOR
+    if color != Game.timer_color:
+        Game.timer_color = color
+        timer_indicator.config(fg=color)
 
 def stop_timer():
     """Halt the countdown timer"""
+    # cancel both the label loop and the time's up call
     if Game.timer_reference:
         main_window.after_cancel(Game.timer_reference)
         Game.timer_reference = None
+    if Game.expiry_reference:
+        main_window.after_cancel(Game.expiry_reference)
+        Game.expiry_reference = None
 
 def time_expired():
     """Handle timer completion"""
-    num1, num2, operation = Game.active_challenge
-    if operation == '+':
-        correct = num1 + num2
-    elif operation == '-':
-        correct = num1 - num2
-    else:
-        correct = num1 * num2
-        
+    Game.expiry_reference = None  # this is the call that was scheduled
+    stop_timer()
+    show_time_left(0)
+    correct = Game.active_challenge[3]  # answer was worked out when the game started
+
     show_feedback(f"TIME'S UP! ANSWER: {correct}", "#FF4081", duration=None)
     disable_player_input()
     main_window.after(2000, advance_to_next)
 
 
 # === Input Control System ===
+# Runs on every key press (validatecommand) - rejects anything that isnt a whole number
+# so by the time SOLVE is pressed the answer box can only hold digits
+def is_number_so_far(text):
+    """Allow an empty box, a lone minus sign, or a (negative) whole number"""
+    digits = text[1:] if text.startswith("-") else text
+    return digits == "" or digits.isdecimal()
+
 def disable_player_input():
     """Prevent player interaction during transitions"""
     answer_input.config(state="disabled")
@@ -372,7 +496,7 @@ def advance_to_next():
     Game.problems_solved += 1
     if Game.problems_solved < MAX_CHALLENGES:
         enable_player_input()
-        GameEngine.present_challenge(Game.current_level)
+        GameEngine.present_challenge()
     else:
         show_game_results()
 
@@ -381,20 +505,19 @@ def check_player_answer():
     """Process and validate player's solution"""
     stop_timer()  # stop the timer while checking
     
-    # make sure they entered a number, not text
-    try:
-        player_answer = int(answer_input.get())
-    except ValueError:
-        # show error if they typed something weird
+    # the box only accepts digits, so just make sure there is a number in it
+    answer_text = answer_var.get()
+    if not answer_text.lstrip("-"):
+        # show error if they didnt type anything
         set_input_state("error")
         show_feedback("PLEASE ENTER A VALID NUMBER", ERROR_COLOR)
         main_window.after(800, set_input_state)  # reset color after a bit
         begin_countdown()
         return
+    player_answer = int(answer_text)
 
-    num1, num2, operation = Game.active_challenge
-    
-    is_correct, base_points = GameEngine.verify_solution(num1, num2, operation, player_answer)
+    correct = Game.active_challenge[3]
+    is_correct, base_points = GameEngine.verify_solution(correct, player_answer)
     
     if is_correct:
         # Apply power-up effects before scoring (like double points)
@@ -402,67 +525,137 @@ def check_player_answer():
         Game.points += actual_points
         
         disable_player_input()  # lock input while showing result
-        score_indicator.config(text=f"SCORE: {Game.points}/{15 * MAX_CHALLENGES}")
+        score_var.set(f"SCORE: {Game.points}/{MAX_SCORE}")
         # wait a bit then move to next problem
         main_window.after(1500, advance_to_next)
     else:
         # if they used up all attempts, move on
+        # (score didnt change so the score label is left alone)
         if Game.attempts_made >= 2:
             disable_player_input()
-            score_indicator.config(text=f"SCORE: {Game.points}/{15 * MAX_CHALLENGES}")
             main_window.after(2000, advance_to_next)
 
+# The game screen widgets are made once and reused for every game,
+# so starting again only has to put their text/state back
+def reset_game_ui():
+    """Put the game screen back to how a fresh game starts"""
+    enable_player_input()
+    set_input_state()
+    score_var.set(f"SCORE: {Game.points}/{MAX_SCORE}")
+    powerup_var.set(f"BOOSTS: {Game.powerup_charges}")
+
 def start_space_adventure(selected_level):
     """Begin a new game with chosen difficulty"""
+    results_window.withdraw()  # the last game's results dont belong to this one
     Game.initialize_new_game(selected_level)
-    enable_player_input()
-    score_indicator.config(text=f"SCORE: {Game.points}/{15 * MAX_CHALLENGES}")
-    powerup_indicator.config(text=f"BOOSTS: {Game.powerup_charges}")
+    reset_game_ui()
     display_screen(game_frame)
 
     # Get or create screen background - this ensures background shows for all levels
+    # the background goes just under game_back_control (the first game widget made)
+    # so it covers the other level backgrounds but stays behind the game interface
+    # - one lower call instead of lifting every game widget above it
     screen_manager = ScreenManager.get_screen_background(game_frame, selected_level)
-    screen_manager.activate()
-
-    # Elevate game interface elements
-    game_elements = [
-        game_back_control,
-        info_panel,
-        challenge_title,
-        timer_indicator,
-        score_indicator,
-        problem_display,
-        input_glow,
-        input_container,
-        result_display,
-        powerup_frame
-    ]
-    for element in game_elements:
-        element.lift()
-
-    GameEngine.present_challenge(Game.current_level)
+    screen_manager.activate(below=game_back_control)
+    # any other level that got hovered but not picked doesnt need its frames anymore
+    drop_prefetched_animations()
+
+    GameEngine.present_challenge()
 
 def show_game_results():
     """Display final game results"""
     stop_timer()
     result_summary, performance_rating = GameEngine.show_final_results()
     
-    if messagebox.askyesno("Mission Complete!", result_summary):
-        display_screen(main_menu_frame)
-    else:
-        main_window.quit()
+    # not a messagebox - that would run its own event loop and freeze the animations
+    results_var.set(result_summary)
+    results_window.deiconify()
+    results_window.lift()
 
 
 # === Screen Management ===
 def display_screen(screen):
     """Switch between different game screens"""
     AnimationManager.stop_all_animations()
+    # every widget gets placed once when the module loads - switching screens
+    # is just tkraise, so nothing in here (or the game flow) should call place again
     screen.tkraise()
-    
-    if screen == main_menu_frame:
-        menu_animation.play()
-    elif screen == level_select_frame:
-        level_select_animation.play()
+
+    # the gif for a screen only gets loaded the first time that screen is shown
+    # so startup doesnt have to decode backgrounds the player might never see
+    # (only the next likely one gets a head start, see prefetch_animation below)
+    animation = screen_animations.get(screen)
+    if animation is None and screen in screen_backgrounds:
+        background_label, animation_path = screen_backgrounds[screen]
+        animation = AnimationManager(background_label, animation_path, APP_WIDTH, APP_HEIGHT)
+        screen_animations[screen] = animation
+    if animation is not None:
+        animation.play()
+    # from the menu the player almost always goes to level select next,
+    # so start decoding its gif on a worker thread while they look at the menu
+    if screen is main_menu_frame:
+        prefetch_animation(DIFFICULTY_BG_PATH, APP_WIDTH, APP_HEIGHT)
+
+
+# === Event Handlers ===
+# named functions for the widget bindings instead of making a lambda for each one
+# tk always passes an event object even though these dont need it
+def on_launch_click(event):
+    """Rocket button - go to level selection"""
+    GameEngine.show_level_selection()
+
+def on_exit_click(event):
+    """Exit button - close the game"""
+    main_window.quit()
+
+def on_return_click(event):
+    """Back button on level select - go to the main menu"""
+    display_screen(main_menu_frame)
+
+def on_level_click(game_level, event):
+    """LAUNCH button on a level card - start that level (bound with functools.partial)"""
+    start_space_adventure(game_level)
+
+def on_launch_hover(game_level, event):
+    """Mouse over a LAUNCH button - show the hand cursor and start decoding that level's background"""
+    event.widget.config(cursor="hand2")
+    # the click usually comes a moment later, so the gif is (nearly) ready by then
+    prefetch_animation(game_level.background_path, APP_WIDTH, APP_HEIGHT)
+
+def on_launch_leave(event):
+    """Mouse left a LAUNCH button - back to the normal cursor"""
+    event.widget.config(cursor="")
+
+def on_play_again():
+    """Results window - hide it and go back to the main menu"""
+    results_window.withdraw()
+    stop_timer()  # in case a game got going behind the results window
+    display_screen(main_menu_frame)
+
+def on_quit_game():
+    """Results window - close the game"""
+    results_window.withdraw()
+    main_window.quit()
+
+def on_game_back_click(event):
+    """Back button during a game - stop the timer and go to level select"""
+    stop_timer()
+    results_window.withdraw()
+    display_screen(level_select_frame)
+
+# submit is bound once here so pressing enter doesnt have to look it up every time
+def on_answer_return(event, submit=check_player_answer):
+    """Enter key in the answer box submits the answer"""
+    submit()
+
+def on_answer_change(new_text):
+    """validatecommand for the answer box - only numbers get in, and a real edit clears the error color"""
+    if not is_number_so_far(new_text):
+        return False
+    # only bother when the box is actually showing the error color
+    if input_in_error:
+        set_input_state()
+    return True
 
 
 # === Main Application Window ===
@@ -472,6 +665,23 @@ main_window.title("Space Math Adventure")
 main_window.geometry(f"{APP_WIDTH}x{APP_HEIGHT}")
 main_window.resizable(False, False)  # dont let them resize it
 
+# One named font per size/weight - tk makes the font once and every widget
+# using it shares it, instead of looking up a new font for each font tuple.
+# lru_cache also keeps the Font objects alive (tk deletes them when they get garbage collected)
+# resizing everything at that size is just arial_font(16, "bold").configure(size=...)
+@functools.lru_cache(maxsize=None)
+def arial_font(size, weight="normal"):
+    """Get the shared Arial font for this size and weight"""
+    return tkfont.Font(root=main_window, family="Arial", size=size, weight=weight)
+
+# load every button image up front in parallel
+preload_images([
+    (START_IMG_PATH, 300, 65, (0, 0, 0)),
+    (QUIT_IMG_PATH, 300, 65, (0, 0, 0)),
+    (BACK_IMG_PATH, 300, 65, None),
+    (BACK_IMG_PATH, 180, 50, None),
+])
+
 # Create the different screens (menu, level select, game)
 # using frames that we can switch between
 main_menu_frame = tk.Frame(main_window, bg="black")
@@ -482,81 +692,98 @@ game_frame = tk.Frame(main_window, bg=PRIMARY_BG)
 for screen in (main_menu_frame, level_select_frame, game_frame):
     screen.place(relwidth=1, relheight=1)
 
+# background label + gif for each screen, and the animations made from them so far
+# (the game screen backgrounds are handled by ScreenManager instead)
+screen_backgrounds = {}
+screen_animations = {}
+
 
 # === Main Menu Screen ===
 menu_background = tk.Label(main_menu_frame)
 menu_background.place(x=0, y=0, relwidth=1, relheight=1)
-menu_animation = AnimationManager(menu_background, MENU_BG_PATH, APP_WIDTH, APP_HEIGHT)
+screen_backgrounds[main_menu_frame] = (menu_background, MENU_BG_PATH)
 
 # Title Section
 title_label = tk.Label(main_menu_frame, text="SPACE MATH ADVENTURE", 
-                      font=("Arial", 32, "bold"), bg="black", fg="#FFD700",
+                      font=arial_font(32, "bold"), bg="black", fg=TITLE_GOLD,
                       pady=20)
 title_label.place(relx=0.5, rely=0.2, anchor="center")
 
 subtitle_label = tk.Label(main_menu_frame, text="Master Mathematics Among the Stars", 
-                         font=("Arial", 16), bg="black", fg="#4FC3F7")
+                         font=arial_font(16), bg="black", fg=INFO_COLOR)
 subtitle_label.place(relx=0.5, rely=0.3, anchor="center")
 
 # Launch Adventure button - using image instead of text button
 launch_image = load_image_with_aspect(START_IMG_PATH, 300, 65, remove_color=(0, 0, 0))
 launch_button = tk.Label(main_menu_frame, image=launch_image, bg="black", cursor="hand2")
 launch_button.image = launch_image  # need to keep reference or image disappears
-launch_button.bind("<Button-1>", lambda e: GameEngine.show_level_selection())
+launch_button.bind("<Button-1>", on_launch_click)
 launch_button.place(relx=0.5, rely=0.6, anchor="center")
 
 # Exit Mission button
 exit_image = load_image_with_aspect(QUIT_IMG_PATH, 300, 65, remove_color=(0, 0, 0))
 exit_button = tk.Label(main_menu_frame, image=exit_image, bg="black", cursor="hand2")
 exit_button.image = exit_image
-exit_button.bind("<Button-1>", lambda e: main_window.quit())
+exit_button.bind("<Button-1>", on_exit_click)
 exit_button.place(relx=0.5, rely=0.75, anchor="center")
 
 
 # === Level Selection Screen ===
 level_select_background = tk.Label(level_select_frame)
 level_select_background.place(x=0, y=0, relwidth=1, relheight=1)
-level_select_animation = AnimationManager(level_select_background, DIFFICULTY_BG_PATH, APP_WIDTH, APP_HEIGHT)
+screen_backgrounds[level_select_frame] = (level_select_background, DIFFICULTY_BG_PATH)
 
 # Level selection title
 level_title = tk.Label(level_select_frame, text="CHOOSE YOUR MISSION", 
-                      font=("Arial", 28, "bold"), bg="black", fg="#FFD700")
+                      font=arial_font(28, "bold"), bg="black", fg=TITLE_GOLD)
 level_title.place(relx=0.5, rely=0.1, anchor="center")
 
-# Level selection options
-space_levels = [
-    ("BEGINNER", "Numbers 1-15\nBasic Operations", 150, GameLevel.BEGINNER),
-    ("EXPLORER", "Numbers 10-50\nAll Operations", 250, GameLevel.EXPLORER),
-    ("MASTER", "Numbers 50-200\nComplex Challenges", 350, GameLevel.MASTER)
-]
-
-for level_name, description, y_position, game_level in space_levels:
+# Builds one level option card (name, description and launch button)
+# everything is drawn on one canvas per card instead of a frame + 3 labels,
+# so tk only has one window to redraw for each card
+def build_level_card(parent, level_name, description, y_position, game_level):
+    """Create the selection card for one level and return its canvas"""
     # Level container
-    level_container = tk.Frame(level_select_frame, bg="#2C3E50", relief=tk.RAISED, bd=2)
-    level_container.place(x=200, y=y_position, width=560, height=80)
-    
+    level_container = tk.Canvas(parent, bg="#2C3E50", relief=tk.RAISED, bd=2,
+                                highlightthickness=0)
+
     # Level name
-    name_label = tk.Label(level_container, text=level_name, font=("Arial", 18, "bold"),
-                         bg="#2C3E50", fg="white", padx=20, pady=10)
-    name_label.place(x=10, y=13)
-    
+    level_container.create_text(30, 23, text=level_name, font=arial_font(18, "bold"),
+                                fill="white", anchor="nw")
+
     # Level description
-    desc_label = tk.Label(level_container, text=description, font=("Arial", 11),
-                         bg="#2C3E50", fg="lightblue", justify=tk.LEFT)
-    desc_label.place(x=225, y=20)
-    
-    # Launch level button
-    level_btn = tk.Label(level_container, text="LAUNCH", font=("Arial", 14, "bold"),
-                        bg="#E74C3C", fg="white", cursor="hand2", 
-                        padx=25, pady=12, relief=tk.RAISED, bd=3)
-    level_btn.bind("<Button-1>", lambda e, gl=game_level: start_space_adventure(gl))
-    level_btn.place(x=400, y=13)
+    level_container.create_text(225, 20, text=description, font=arial_font(11),
+                                fill="lightblue", justify=tk.LEFT, anchor="nw")
+
+    # Launch level button - a rectangle sized like the old padded label would be
+    launch_font = arial_font(14, "bold")
+    button_width = launch_font.measure("LAUNCH") + 56  # padx 25 + border 3 on each side
+    button_height = launch_font.metrics("linespace") + 30  # pady 12 + border 3
+    level_container.create_rectangle(400, 13, 400 + button_width, 13 + button_height,
+                                     fill="#E74C3C", outline="#F1948A", width=3, tags="launch")
+    level_container.create_text(400 + button_width // 2, 13 + button_height // 2, text="LAUNCH",
+                                font=launch_font, fill="white", tags="launch")
+    level_container.tag_bind("launch", "<Button-1>", functools.partial(on_level_click, game_level))
+    level_container.tag_bind("launch", "<Enter>", functools.partial(on_launch_hover, game_level))
+    level_container.tag_bind("launch", "<Leave>", on_launch_leave)
+
+    level_container.place(x=200, y=y_position, width=560, height=80)
+    return level_container
+
+
+# Level selection options
+beginner_card = build_level_card(level_select_frame, "BEGINNER", "Numbers 1-15\nBasic Operations",
+                                 150, GameLevel.BEGINNER)
+explorer_card = build_level_card(level_select_frame, "EXPLORER", "Numbers 10-50\nAll Operations",
+                                 250, GameLevel.EXPLORER)
+master_card = build_level_card(level_select_frame, "MASTER", "Numbers 50-200\nComplex Challenges",
+                               350, GameLevel.MASTER)
 
 # Return to menu
 return_image = load_image_with_aspect(BACK_IMG_PATH, 300, 65)
 return_button = tk.Label(level_select_frame, image=return_image, bg="black", cursor="hand2")
 return_button.image = return_image
-return_button.bind("<Button-1>", lambda e: display_screen(main_menu_frame))
+return_button.bind("<Button-1>", on_return_click)
 return_button.place(relx=0.5, rely=0.9, anchor="center")
 
 
@@ -565,7 +792,7 @@ return_button.place(relx=0.5, rely=0.9, anchor="center")
 game_return_image = load_image_with_aspect(BACK_IMG_PATH, 180, 50)
 game_back_control = tk.Label(game_frame, image=game_return_image, bg="black", cursor="hand2")
 game_back_control.image = game_return_image
-game_back_control.bind("<Button-1>", lambda e: (stop_timer(), display_screen(level_select_frame)))
+game_back_control.bind("<Button-1>", on_game_back_click)
 game_back_control.place(x=25, y=10)
 
 # Challenge progress and indicators
@@ -581,9 +808,19 @@ info_panel = tk.Frame(
 )
 info_panel.place(relx=0.5, y=85, anchor="center")
 
+# the labels that change during the game show StringVars
+# so updating them is just var.set() instead of a full config() call
+challenge_var = tk.StringVar()
+timer_var = tk.StringVar()
+score_var = tk.StringVar()
+problem_var = tk.StringVar()
+result_var = tk.StringVar()
+powerup_var = tk.StringVar(value="BOOSTS: 3")
+
 challenge_title = tk.Label(
     info_panel,
-    font=("Arial", 20, "bold"),
+    textvariable=challenge_var,
+    font=arial_font(20, "bold"),
     fg=ACCENT_GOLD,
     bg=PANEL_BG,
     padx=10
@@ -592,8 +829,9 @@ challenge_title.grid(row=0, column=0, padx=20)
 
 timer_indicator = tk.Label(
     info_panel,
-    font=("Arial", 16, "bold"),
-    bg="#0A2A43",
+    textvariable=timer_var,
+    font=arial_font(16, "bold"),
+    bg=HUD_BG,
     fg=WARNING_COLOR,
     padx=15,
     pady=6
@@ -602,8 +840,9 @@ timer_indicator.grid(row=0, column=1, padx=20)
 
 score_indicator = tk.Label(
     info_panel,
-    font=("Arial", 16, "bold"),
-    bg="#0A2A43",
+    textvariable=score_var,
+    font=arial_font(16, "bold"),
+    bg=HUD_BG,
     fg=ACCENT_GOLD,
     padx=15,
     pady=6
@@ -613,9 +852,10 @@ score_indicator.grid(row=0, column=2, padx=20)
 # Math problem display
 problem_display = tk.Label(
     game_frame,
-    font=("Arial", 26, "bold"),
+    textvariable=problem_var,
+    font=arial_font(26, "bold"),
     bg=PANEL_BG,
-    fg="#FFFFFF",
+    fg=TEXT_COLOR,
     padx=40,
     pady=20,
     highlightbackground=ACCENT_CYAN,
@@ -641,32 +881,32 @@ input_container = tk.Frame(
 input_container.pack()
 
 # Player answer input - where they type their answer
+answer_var = tk.StringVar()
 answer_input = tk.Entry(
     input_container,
-    font=("Arial", 22, "bold"),
+    textvariable=answer_var,
+    validate="key",  # check every edit so only numbers can be typed
+    validatecommand=(main_window.register(on_answer_change), "%P"),
+    font=arial_font(22, "bold"),
     width=10,
     bg=ENTRY_BG,
     fg=ENTRY_TEXT_COLOR,
-    insertbackground="#FFFFFF",
+    insertbackground=TEXT_COLOR,
     relief=tk.FLAT,
     justify="center"
 )
 answer_input.pack(side=tk.LEFT, padx=12)
 # pressing enter submits the answer
-answer_input.bind('<Return>', lambda e: check_player_answer())
-# reset color when they focus or type
-answer_input.bind('<FocusIn>', lambda e: set_input_state())
-answer_input.bind('<Key>', lambda e: set_input_state())
-set_input_state()  # set initial color
+answer_input.bind('<Return>', on_answer_return)
 
 # Submit action button
 submit_action = tk.Button(
     input_container,
     text="SOLVE",
-    font=("Arial", 16, "bold"),
+    font=arial_font(16, "bold"),
     command=check_player_answer,
     bg=ACCENT_ORANGE,
-    fg="#FFFFFF",
+    fg=TEXT_COLOR,
     activebackground="#FF9B54",
     relief=tk.FLAT,
     cursor="hand2",
@@ -678,9 +918,10 @@ submit_action.pack(side=tk.LEFT, padx=(12, 5))
 # Result feedback
 result_display = tk.Label(
     game_frame,
-    font=("Arial", 18, "bold"),
+    textvariable=result_var,
+    font=arial_font(18, "bold"),
     bg=PRIMARY_BG,
-    fg="#FFFFFF",
+    fg=TEXT_COLOR,
     pady=8
 )
 result_display.place(relx=0.5, y=360, anchor="center")
@@ -702,7 +943,7 @@ powerup_frame.place(relx=0.82, y=300, anchor="center")
 powerup_title = tk.Label(
     powerup_frame,
     text="SPACE BOOSTS 🚀",
-    font=("Arial", 13, "bold"),
+    font=arial_font(13, "bold"),
     bg=PANEL_BG,
     fg=ACCENT_GOLD
 )
@@ -711,8 +952,8 @@ powerup_title.pack(pady=(5, 10))
 # Boost counter
 powerup_indicator = tk.Label(
     powerup_frame,
-    text="BOOSTS: 3",
-    font=("Arial", 11, "bold"),
+    textvariable=powerup_var,
+    font=arial_font(11, "bold"),
     bg=PANEL_BG,
     fg=SUCCESS_COLOR
 )
@@ -722,7 +963,7 @@ powerup_indicator.pack()
 time_boost_btn = tk.Button(
     powerup_frame,
     text="⏰ TIME BOOST\n+15 Seconds",
-    font=("Arial", 10, "bold"),
+    font=arial_font(10, "bold"),
     command=activate_time_boost,
     bg="#1565C0",
     fg="white",
@@ -739,7 +980,7 @@ time_boost_btn.pack(pady=8)
 double_points_btn = tk.Button(
     powerup_frame,
     text="💎 DOUBLE POINTS\nNext Answer x2",
-    font=("Arial", 10, "bold"),
+    font=arial_font(10, "bold"),
     command=activate_double_points,
     bg="#9C27B0",
     fg="white",
@@ -756,13 +997,70 @@ double_points_btn.pack(pady=8)
 instructions = tk.Label(
     powerup_frame,
     text="Use boosts wisely!\nLimited supply.",
-    font=("Arial", 9),
+    font=arial_font(9),
     bg=PANEL_BG,
     fg="#B0BEC5"
 )
 instructions.pack(pady=(10, 5))
 
 
+# === Results Window ===
+# built once and hidden - show_game_results just fills in the text and shows it
+results_window = tk.Toplevel(main_window)
+results_window.title("Mission Complete!")
+results_window.configure(bg=PANEL_BG, padx=25, pady=20)
+results_window.resizable(False, False)
+results_window.transient(main_window)  # keep it on top of the game window
+results_window.protocol("WM_DELETE_WINDOW", on_play_again)  # closing it counts as play again
+
+results_var = tk.StringVar()
+results_message = tk.Label(
+    results_window,
+    textvariable=results_var,
+    font=arial_font(14, "bold"),
+    bg=PANEL_BG,
+    fg=TEXT_COLOR,
+    justify="center"
+)
+results_message.pack(pady=(0, 15))
+
+results_buttons = tk.Frame(results_window, bg=PANEL_BG)
+results_buttons.pack()
+
+play_again_btn = tk.Button(
+    results_buttons,
+    text="PLAY AGAIN",
+    font=arial_font(12, "bold"),
+    command=on_play_again,
+    bg=SUCCESS_COLOR,
+    fg=PRIMARY_BG,
+    relief=tk.FLAT,
+    padx=20,
+    pady=6,
+    cursor="hand2"
+)
+play_again_btn.pack(side=tk.LEFT, padx=8)
+
+quit_game_btn = tk.Button(
+    results_buttons,
+    text="QUIT",
+    font=arial_font(12, "bold"),
+    command=on_quit_game,
+    bg=ERROR_COLOR,
+    fg=TEXT_COLOR,
+    relief=tk.FLAT,
+    padx=20,
+    pady=6,
+    cursor="hand2"
+)
+quit_game_btn.pack(side=tk.LEFT, padx=8)
+
+results_window.withdraw()
+
+
 # Initialize application - start with the main menu
+# work out the layout of every widget in one go before anything is shown
+# (the window cant be resized so this is the only layout pass it needs)
+main_window.update_idletasks()
 display_screen(main_menu_frame)
 main_window.mainloop()  # start the event loop
\ No newline at end of file
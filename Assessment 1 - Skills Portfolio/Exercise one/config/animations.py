@@ -1,54 +1,107 @@
 from PIL import Image, ImageTk, ImageSequence
 import tkinter as tk
+import threading
+import weakref
+from concurrent.futures import Future
 
 from config.settings import *
 
+# Decoding + resizing every gif frame is the slow part of making an animation.
+# That part is plain PIL so it can run on a worker thread while tk keeps going,
+# only turning the frames into PhotoImages has to happen on the main thread
+_pending_frames = {}  # (path, width, height) -> Future of the decoded frames
+
+
+def decode_animation_frames(animation_path, width, height):
+    """Open a gif and return its frames resized to width x height"""
+    animation = Image.open(animation_path)
+    # bilinear is plenty for a moving background and a lot quicker than LANCZOS
+    return [frame.copy().resize((width, height), Image.BILINEAR)
+            for frame in ImageSequence.Iterator(animation)]
+
+
+def _decode_into(future, animation_path, width, height):
+    """Worker thread body - decode the frames and hand them to the future"""
+    try:
+        future.set_result(decode_animation_frames(animation_path, width, height))
+    except Exception as e:
+        future.set_exception(e)
+
+
+def prefetch_animation(animation_path, width, height):
+    """Start decoding an animation in the background before it is needed"""
+    key = (animation_path, width, height)
+    if key in _pending_frames or key in AnimationManager._frame_cache:
+        return
+    future = _pending_frames[key] = Future()
+    # daemon so closing the game doesnt have to wait for a decode nobody needs anymore
+    threading.Thread(target=_decode_into, args=(future, *key), daemon=True).start()
+
+
+def drop_prefetched_animations():
+    """Forget prefetched frames that never got used (a still running decode just gets thrown away)"""
+    _pending_frames.clear()
+
+
 class AnimationManager:
-    _active_animations = []
+    # weak so a manager nobody uses anymore (and its frames) can be freed
+    _active_animations = weakref.WeakSet()
+    _frame_cache = {}  # (path, width, height) -> tuple of PhotoImage frames, shared between managers
+    _frame_delay = 45  # ms between frames
+    _driver_task = None  # the shared after() that ticks all the animations
+    _driver_root = None  # window the shared after() runs on (outlives any one display label)
 
     def __init__(self, display_label, animation_path, width, height):
         self.display = display_label
-        self.animation_frames = []
+        self.animation_frames = ()
         self.current_frame_index = 0
-        self.animation_task = None
         self.is_playing = False
 
         # Load animation frames
+        key = (animation_path, width, height)
         try:
-            animation = Image.open(animation_path)
-            for frame in ImageSequence.Iterator(animation):
-                adjusted_frame = frame.copy().resize((width, height), Image.LANCZOS)
-                self.animation_frames.append(ImageTk.PhotoImage(adjusted_frame))
+            cached_frames = AnimationManager._frame_cache.get(key)
+            if cached_frames is None:
+                # picks up the frames from prefetch_animation if it was called (waits if
+                # they are still decoding), otherwise decodes them now
+                prefetch_animation(animation_path, width, height)
+                frames = _pending_frames.pop(key).result()
+                cached_frames = tuple(ImageTk.PhotoImage(adjusted_frame) for adjusted_frame in frames)
+                AnimationManager._frame_cache[key] = cached_frames
+            self.animation_frames = cached_frames
         except Exception as e:
             print(f"Error loading animation: {e}")
             # Create a fallback colored frame
             fallback_image = Image.new('RGB', (width, height), color='lightblue')
-            self.animation_frames.append(ImageTk.PhotoImage(fallback_image))
+            self.animation_frames = (ImageTk.PhotoImage(fallback_image),)
 
-        AnimationManager._active_animations.append(self)
+        # frames never change after loading, so the count is worked out once here
+        self.frame_count = len(self.animation_frames)
+        AnimationManager._active_animations.add(self)
 
     def start_animation(self):
         """Start the animation from the beginning"""
         self.stop_animation()
         self.current_frame_index = 0
         self.is_playing = True
-        self.animate_sequence()
+        self.animate_sequence()  # show the first frame straight away
+        AnimationManager._start_driver(self.display)
 
     def play(self):
         """Alias for start_animation - fixes the AttributeError"""
         self.start_animation()
 
     def animate_sequence(self):
-        """Continue animating frames"""
+        """Show the current frame and move on to the next one"""
         if self.is_playing and self.animation_frames:
+            # frames are already PhotoImages (and animation_frames keeps them alive)
+            # so each tick is just pointing the label at the next one
             self.display.config(image=self.animation_frames[self.current_frame_index])
-            self.display.image = self.animation_frames[self.current_frame_index]
-            self.current_frame_index = (self.current_frame_index + 1) % len(self.animation_frames)
-            self.animation_task = self.display.after(45, self.animate_sequence)
+            next_index = self.current_frame_index + 1
+            self.current_frame_index = 0 if next_index == self.frame_count else next_index
 
     def pause(self):
         """Pause the animation"""
-        self.is_playing = False
         self.stop_animation()
 
     def resume(self):
@@ -56,23 +109,53 @@ class AnimationManager:
         if not self.is_playing:
             self.is_playing = True
             self.animate_sequence()
+            AnimationManager._start_driver(self.display)
 
     def stop_animation(self):
         """Stop the animation completely"""
+        # the shared timer just skips it from now on (and stops once nothing is playing)
         self.is_playing = False
-        if self.animation_task:
-            self.display.after_cancel(self.animation_task)
-            self.animation_task = None
 
-    def set_frame_rate(self, delay_ms):
-        """Change animation speed"""
+    def destroy(self):
+        """Stop the animation and let go of its frames"""
         self.stop_animation()
-        if self.is_playing:
-            self.animation_task = self.display.after(delay_ms, self.animate_sequence)
+        AnimationManager._active_animations.discard(self)
+        self.animation_frames = ()
+        self.frame_count = 0
+
+    @classmethod
+    def set_frame_rate(cls, delay_ms):
+        """Change animation speed (for every animation, they all share one timer)"""
+        cls._frame_delay = delay_ms
+
+    # One after() moves every playing animation on, instead of each animation
+    # keeping its own timer going
+    @classmethod
+    def _start_driver(cls, widget):
+        """Schedule the shared animation timer if it isnt already running"""
+        if cls._driver_task is None:
+            # run it on the window, not the label - a label can get destroyed while others keep playing
+            cls._driver_root = widget.winfo_toplevel()
+            cls._driver_task = cls._driver_root.after(cls._frame_delay, cls._tick)
+
+    @classmethod
+    def _tick(cls):
+        """Advance every playing animation by one frame"""
+        cls._driver_task = None
+        playing = [anim for anim in cls._active_animations if anim.is_playing]
+        for anim in playing:
+            try:
+                anim.animate_sequence()
+            except Exception as e:
+                # one broken animation (like a destroyed label) shouldnt stop all the others
+                print(f"Error playing animation: {e}")
+                anim.stop_animation()
+        if playing:
+            cls._driver_task = cls._driver_root.after(cls._frame_delay, cls._tick)
 
     def get_frame_count(self):
         """Get total number of frames"""
-        return len(self.animation_frames)
+        return self.frame_count
 
     def get_current_frame(self):
         """Get current frame number"""
@@ -80,11 +163,10 @@ class AnimationManager:
 
     def goto_frame(self, frame_index):
         """Jump to specific frame"""
-        if 0 <= frame_index < len(self.animation_frames):
+        if 0 <= frame_index < self.frame_count:
             self.current_frame_index = frame_index
             if self.is_playing:
                 self.display.config(image=self.animation_frames[self.current_frame_index])
-                self.display.image = self.animation_frames[self.current_frame_index]
 
     @classmethod
     def stop_all_animations(cls):
@@ -125,9 +207,14 @@ class ScreenManager:
     @classmethod
     def get_screen_background(cls, parent_screen, game_level):
         """Get or create screen background with caching"""
-        if game_level not in cls._screen_cache:
-            cls._screen_cache[game_level] = cls(parent_screen, game_level)
-        return cls._screen_cache[game_level]
+        # keyed by the parent too - a background label can only show inside the screen it was made in
+        key = (parent_screen, game_level)
+        screen = cls._screen_cache.get(key)
+        if screen is not None and not screen.background.winfo_exists():
+            screen = None  # its screen got destroyed, make a fresh one
+        if screen is None:
+            screen = cls._screen_cache[key] = cls(parent_screen, game_level)
+        return screen
 
     def play_background(self):
         """Start background animation"""
@@ -141,9 +228,13 @@ class ScreenManager:
         """Pause background animation"""
         self.animation.pause()
 
-    def activate(self):
+    def activate(self, below=None):
         """Activate this screen"""
-        self.background.tkraise()
+        if below is None:
+            self.background.tkraise()
+        else:
+            # slot the background in right under that widget instead of on top of everything
+            self.background.lower(below)
         self.play_background()
 
     def set_background_color(self, color):
@@ -153,5 +244,5 @@ class ScreenManager:
 
     def destroy(self):
         """Clean up resources"""
-        self.animation.stop_animation()
+        self.animation.destroy()
         self.background.destroy()
\ No newline at end of file
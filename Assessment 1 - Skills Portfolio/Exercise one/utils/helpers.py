@@ -1,15 +1,17 @@
+import operator
+import os
 import random
 
+# operation symbol -> the function that does it, so there's no if/elif chain
+OPERATOR_FUNCTIONS = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+
 class MathHelper:
     @staticmethod
     def calculate_result(number1, number2, operation):
-        if operation == '+':
-            return number1 + number2
-        elif operation == '-':
-            return number1 - number2
-        elif operation == '*':
-            return number1 * number2
-        return 0
+        calculate = OPERATOR_FUNCTIONS.get(operation)
+        if calculate is None:
+            return 0
+        return calculate(number1, number2)
 
 class PowerUpManager:
     def __init__(self):
@@ -22,4 +24,23 @@ class PowerUpManager:
         return False
         
     def reset_boosts(self):
-        self.available_boosts = 3
\ No newline at end of file
+        self.available_boosts = 3
+
+# Works out how big an image can be inside a box without squishing it
+# basically checking if image is wider or taller than what we want
+def fit_within(width, height, max_width, max_height):
+    """Return the (width, height) that fits inside the box keeping aspect ratio"""
+    original_ratio = width / height
+    target_ratio = max_width / max_height
+
+    if original_ratio > target_ratio:
+        # Image is wider
+        return max_width, int(max_width / original_ratio)
+    # Image is taller
+    return int(max_height * original_ratio), max_height
+
+
+def sized_asset_path(path, max_width, max_height):
+    """Path of the pre-resized copy of an asset, e.g. rocket_btn_300x65.png"""
+    base, ext = os.path.splitext(path)
+    return f"{base}_{max_width}x{max_height}{ext}"
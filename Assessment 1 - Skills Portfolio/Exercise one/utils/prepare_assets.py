@@ -0,0 +1,31 @@
+# Offline helper that saves pre-resized copies of the button images
+# the game looks for these first so it doesnt have to resize on every startup
+# run it from the "Exercise one" folder with: python -m utils.prepare_assets
+
+from PIL import Image
+
+from config.settings import START_IMG_PATH, QUIT_IMG_PATH, BACK_IMG_PATH
+from utils.helpers import fit_within, sized_asset_path
+
+# every (image, width, height) combo the game asks for
+BUTTON_SIZES = [
+    (START_IMG_PATH, 300, 65),
+    (QUIT_IMG_PATH, 300, 65),
+    (BACK_IMG_PATH, 300, 65),
+    (BACK_IMG_PATH, 180, 50),
+]
+
+
+def prepare_assets():
+    """Write a resized copy of each button image next to the original"""
+    for path, max_width, max_height in BUTTON_SIZES:
+        original = Image.open(path).convert("RGBA")
+        new_size = fit_within(original.width, original.height, max_width, max_height)
+        resized = original.resize(new_size, Image.LANCZOS)
+        target = sized_asset_path(path, max_width, max_height)
+        resized.save(target)
+        print(f"Saved {target} ({new_size[0]}x{new_size[1]})")
+
+
+if __name__ == "__main__":
+    prepare_assets()
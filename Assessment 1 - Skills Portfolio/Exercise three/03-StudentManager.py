@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -16,42 +19,44 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_PATH = BASE_DIR / "A1 - Resources" / "studentMarks.txt"
 
 
+# Percentage cut-offs for each grade, highest first (below 40 is an F)
+GRADE_BOUNDARIES = ((70, "A"), (60, "B"), (50, "C"), (40, "D"))
+
+
 # Using dataclass to store student info - makes it easier to work with
-@dataclass
+# frozen so the totals worked out in __post_init__ can never go stale,
+# updating a student means making a new record with dataclasses.replace
+# (every field is immutable too - marks are a tuple - so records can be hashed)
+# slots=True (python 3.10+) means no __dict__ per record, so less memory and quicker attribute reads
+@dataclass(frozen=True, slots=True)
 class StudentRecord:
     student_id: int
     name: str
-    coursework_marks: List[int]  # list of 3 coursework marks
+    coursework_marks: Tuple[int, int, int]  # the 3 coursework marks
     exam_mark: int
 
-    # Calculate total coursework marks (out of 60)
-    @property
-    def coursework_total(self) -> int:
-        return sum(self.coursework_marks)
-
-    # Total of coursework + exam (out of 160)
-    @property
-    def overall_total(self) -> int:
-        return self.coursework_total + self.exam_mark
-
-    # Calculate percentage based on 160 total marks
-    @property
-    def percentage(self) -> float:
-        return (self.overall_total / 160) * 100
-
-    # Assign grade based on percentage
-    @property
-    def grade(self) -> str:
-        pct = self.percentage
-        if pct >= 70:
-            return "A"
-        if pct >= 60:
-            return "B"
-        if pct >= 50:
-            return "C"
-        if pct >= 40:
-            return "D"
-        return "F"
+    # worked out once when the record is made instead of on every access
+    coursework_total: int = field(init=False)  # out of 60
+    overall_total: int = field(init=False)  # coursework + exam, out of 160
+    percentage: float = field(init=False)  # based on 160 total marks
+    grade: str = field(init=False)
+    # the format_record text, built once since a frozen record can't change
+    record_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        coursework_total = sum(self.coursework_marks)
+        overall_total = coursework_total + self.exam_mark
+        percentage = (overall_total / 160) * 100
+        # first boundary they reach, so a high mark stops checking straight away
+        grade = next(
+            (letter for boundary, letter in GRADE_BOUNDARIES if percentage >= boundary), "F"
+        )
+        # frozen dataclass, so the fields have to be set this way
+        object.__setattr__(self, "coursework_total", coursework_total)
+        object.__setattr__(self, "overall_total", overall_total)
+        object.__setattr__(self, "percentage", percentage)
+        object.__setattr__(self, "grade", grade)
+        object.__setattr__(self, "record_text", build_record_text(self))
 
 
 # Load students from the text file
@@ -62,34 +67,31 @@ def load_students() -> List[StudentRecord]:
     students: List[StudentRecord] = []
     try:
         with DATA_PATH.open(encoding="utf-8") as dataset:
-            lines = [line.strip() for line in dataset.readlines() if line.strip()]
+            # go through the file line by line instead of reading it all into a list first
+            # skip first line (its just the count) and process each student
+            next(dataset, None)
+            for row in dataset:
+                parts = row.split(",")
+                if len(parts) != 6:  # should have 6 parts (also skips blank lines)
+                    continue
+                try:
+                    # int() ignores spaces around the number so only the name needs strip()
+                    student_id = int(parts[0])
+                    coursework = tuple(int(mark) for mark in parts[2:5])  # convert cw marks to ints
+                    exam = int(parts[5])
+                except ValueError:
+                    continue  # skip invalid rows
+
+                students.append(
+                    StudentRecord(
+                        student_id=student_id,
+                        name=parts[1].strip(),
+                        coursework_marks=coursework,
+                        exam_mark=exam,
+                    )
+                )
     except FileNotFoundError:
-        return students  # return empty list if file doesnt exist
-
-    if not lines:
-        return students
-
-    # skip first line (its just the count) and process each student
-    for row in lines[1:]:
-        parts = [part.strip() for part in row.split(",")]
-        if len(parts) != 6:  # should have 6 parts
-            continue
-        try:
-            student_id = int(parts[0])
-            name = parts[1]
-            coursework = list(map(int, parts[2:5]))  # convert cw marks to ints
-            exam = int(parts[5])
-        except ValueError:
-            continue  # skip invalid rows
-
-        students.append(
-            StudentRecord(
-                student_id=student_id,
-                name=name,
-                coursework_marks=coursework,
-                exam_mark=exam,
-            )
-        )
+        pass  # return empty list if file doesnt exist
 
     return students
 
@@ -98,19 +100,18 @@ def load_students() -> List[StudentRecord]:
 # used when adding, deleting, or updating students
 def save_students(students: List[StudentRecord]) -> None:
     """Persist records back to the dataset file."""
-    lines = [str(len(students))]  # first line is the count
-    for student in students:
-        coursework = ",".join(map(str, student.coursework_marks))
-        # format: id,name,cw1,cw2,cw3,exam
-        lines.append(
-            f"{student.student_id},{student.name},{coursework},{student.exam_mark}"
-        )
-
-    DATA_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # format: id,name,cw1,cw2,cw3,exam (load_students only keeps rows with 3 coursework marks)
+    body = "".join(
+        f"{student.student_id},{student.name},{student.coursework_marks[0]},"
+        f"{student.coursework_marks[1]},{student.coursework_marks[2]},{student.exam_mark}\n"
+        for student in students
+    )
+    # first line is the count
+    DATA_PATH.write_text(f"{len(students)}\n{body}", encoding="utf-8")
 
 
-def format_record(record: StudentRecord) -> str:
-    """Return a nicely structured textual representation."""
+def build_record_text(record: StudentRecord) -> str:
+    """Build the nicely structured text for a record (StudentRecord stores the result)."""
     return (
         f"Name: {record.name}\n"
         f"ID: {record.student_id}\n"
@@ -121,35 +122,36 @@ def format_record(record: StudentRecord) -> str:
     )
 
 
+def format_record(record: StudentRecord) -> str:
+    """Return a nicely structured textual representation."""
+    return record.record_text
+
+
+# Read the coursework and exam marks out of a dialog's entry widgets
+# raises ValueError if any of them isnt a whole number
+def parse_marks(entries) -> Tuple[Tuple[int, int, int], int]:
+    """Return ((cw1, cw2, cw3), exam) from entries keyed cw1/cw2/cw3/exam."""
+    coursework = tuple(int(entries[key].get()) for key in ("cw1", "cw2", "cw3"))
+    return coursework, int(entries["exam"].get())
+
+
+def marks_in_range(coursework: Tuple[int, int, int], exam: int) -> bool:
+    """Coursework marks are out of 20 each and the exam is out of 100."""
+    return all(0 <= mark <= 20 for mark in coursework) and 0 <= exam <= 100
+
+
 def class_summary(students: List[StudentRecord]) -> str:
     if not students:
         return "No student data available."
-    average = sum(student.percentage for student in students) / len(students)
+    # sum the int totals and turn that into a percentage once at the end
+    total_overall = sum(student.overall_total for student in students)
+    average = total_overall / (len(students) * 160) * 100
     return (
         f"Class size: {len(students)}\n"
         f"Average percentage: {average:.2f}%"
     )
 
 
-# Find a student by ID or name
-# can search by typing part of their name or their full ID
-def find_student(students: List[StudentRecord], query: str) -> Optional[StudentRecord]:
-    """Find a student either by numerical id or name substring."""
-    query = query.strip().lower()
-    if not query:
-        return None
-
-    for student in students:
-        # check if they entered a number and it matches an ID
-        if query.isdigit() and int(query) == student.student_id:
-            return student
-        # or check if the query is in their name (case insensitive)
-        if query in student.name.lower():
-            return student
-
-    return None
-
-
 class StudentManagerApp(tk.Tk):
     """Tkinter GUI that exposes student statistics."""
 
@@ -160,7 +162,14 @@ class StudentManagerApp(tk.Tk):
         self.configure(bg="#101820")
 
         self.students = load_students()
+        self._build_lookup()
         self.search_var = tk.StringVar()
+        self._dialogs = {}  # dialogs built so far, hidden between uses
+        self._last_status = ""  # text the status label is showing right now
+        # one worker so saves hit the disk in the order they were made
+        # (pool threads arent daemons, so a save still finishes if the window closes mid-write)
+        self._saver = ThreadPoolExecutor(max_workers=1)
+        self._pending_save = None  # newest save - only its note goes on the status label
 
         self._build_layout()
         self.show_message(
@@ -186,8 +195,8 @@ class StudentManagerApp(tk.Tk):
         primary_buttons = [
             ("View All Records", self.show_all_records),
             ("View Individual Record", self.show_individual_prompt),
-            ("Show Highest Score", lambda: self.show_extreme(highest=True)),
-            ("Show Lowest Score", lambda: self.show_extreme(highest=False)),
+            ("Show Highest Score", partial(self.show_extreme, highest=True)),
+            ("Show Lowest Score", partial(self.show_extreme, highest=False)),
         ]
 
         extension_buttons = [
@@ -276,8 +285,8 @@ class StudentManagerApp(tk.Tk):
 
     def show_message(self, message: str) -> None:
         self.output_text.config(state=tk.NORMAL)
-        self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, message)
+        # swap the whole contents in one edit instead of delete + insert
+        self.output_text.replace("1.0", tk.END, message)
         self.output_text.config(state=tk.DISABLED)
         self.refresh_status("Display updated")
 
@@ -286,12 +295,12 @@ class StudentManagerApp(tk.Tk):
             self.show_message("No records to display.")
             return
 
-        parts = []
-        for idx, student in enumerate(self.students, start=1):
-            parts.append(f"--- Student {idx} ---\n{format_record(student)}")
-
-        parts.append("\n" + class_summary(self.students))
-        self.show_message("\n".join(parts))
+        # build the whole roster in one join, then one insert into the text box
+        records = "\n".join(
+            f"--- Student {idx} ---\n{format_record(student)}"
+            for idx, student in enumerate(self.students, start=1)
+        )
+        self.show_message(f"{records}\n\n{class_summary(self.students)}")
 
     def show_individual_prompt(self) -> None:
         query = self.search_var.get().strip()
@@ -301,7 +310,7 @@ class StudentManagerApp(tk.Tk):
             )
             return
 
-        student = find_student(self.students, query)
+        student = self.find_student(query)
         if not student:
             messagebox.showwarning(
                 "Not Found", f"No student matched '{query}'. Try ID or full name."
@@ -319,34 +328,127 @@ class StudentManagerApp(tk.Tk):
             return
 
         # find the student with max or min overall total
-        target = max(self.students, key=lambda s: s.overall_total) if highest else min(
-            self.students, key=lambda s: s.overall_total
+        by_total = attrgetter("overall_total")
+        target = max(self.students, key=by_total) if highest else min(
+            self.students, key=by_total
         )
         title = "Highest Overall Score" if highest else "Lowest Overall Score"
         self.show_message(f"{title}\n\n{format_record(target)}")
 
+    # Lookup tables for find_student (and the sort cache), rebuilt whenever the student list changes
+    def _build_lookup(self) -> None:
+        self._by_id = {student.student_id: student for student in self.students}
+        # lowercase each name once here instead of on every search
+        self._names_lower = [(student.name.lower(), student) for student in self.students]
+        # full lowercase name -> student, for an instant exact-name match
+        self._by_name_lower = {}
+        for name, student in self._names_lower:
+            self._by_name_lower.setdefault(name, student)  # first student wins like the scan
+        # sorted lists from sort_records, keyed by descending - stale once the list changes
+        self._sorted_cache = {}
+
+    # Find a student by ID or name
+    # can search by typing part of their name or their full ID
+    def find_student(self, query: str) -> Optional[StudentRecord]:
+        """Find a student either by numerical id or name substring."""
+        query = query.strip().lower()
+        if not query:
+            return None
+
+        # check if they entered a number and it matches an ID
+        if query.isdigit():
+            student = self._by_id.get(int(query))
+            if student is not None:
+                return student
+
+        # a full name (any case) is a dict lookup
+        student = self._by_name_lower.get(query)
+        if student is not None:
+            return student
+
+        # or check if the query is in their name (case insensitive)
+        for name, student in self._names_lower:
+            if query in name:
+                return student
+
+        return None
+
     def refresh_status(self, note: str) -> None:
-        self.status_label.config(
-            text=f"Dataset size: {len(self.students)} | {note}"
-        )
+        status = f"Dataset size: {len(self.students)} | {note}"
+        # most views just say "Display updated" again, so skip the label if nothing changed
+        if status != self._last_status:
+            self._last_status = status
+            self.status_label.config(text=status)
 
-    # Save changes to file and reload the data
+    # Save changes to file and refresh the lookups
     # used after add/delete/update operations
+    # (self.students is already up to date so theres no need to read the file back in)
+    # call it after show_message, otherwise "Display updated" covers up the saving note
     def persist_and_refresh(self, note: str) -> None:
-        save_students(self.students)  # write to file
-        self.students = load_students()  # reload to make sure its synced
-        self.refresh_status(note)
+        # write the file on the saver thread so a slow disk doesnt freeze the window
+        # it gets its own copy of the list (records are frozen so a shallow copy is enough)
+        save = self._pending_save = self._saver.submit(save_students, list(self.students))
+        self._build_lookup()
+        self.refresh_status(f"{note} (saving...)")
+        self.after(100, self._check_save, save, note)
+
+    # Poll the save from the Tk thread, since the worker cant touch widgets itself
+    def _check_save(self, save: Future, note: str) -> None:
+        if not save.done():
+            self.after(100, self._check_save, save, note)
+            return
+        error = save.exception()
+        if error is not None:
+            messagebox.showerror("Save Failed", f"Could not write the student file:\n{error}")
+        # an older save finishing late shouldnt put its note back over a newer one
+        if save is not self._pending_save:
+            return
+        self.refresh_status(f"{note} (not saved)" if error is not None else note)
 
     # === Extension Features ===
+    # Each dialog is built the first time it's opened, then hidden instead of destroyed
+    # so opening it again just shows the same widgets (cleared by its reset function)
+    # they're modeless (no grab) so the main window stays usable while one is open
+    def _reopen_dialog(self, key: str) -> bool:
+        dialog = self._dialogs.get(key)
+        if dialog is None:
+            return False
+        if dialog.state() != "withdrawn":
+            # already open - just bring it forward, dont wipe what the user has typed
+            dialog.lift()
+            dialog.focus_set()
+            return True
+        reset = getattr(dialog, "reset", None)
+        if reset is not None:
+            reset()
+        dialog.deiconify()
+        dialog.lift()
+        return True
+
+    def _new_dialog(self, key: str, title: str) -> tk.Toplevel:
+        dialog = tk.Toplevel(self)
+        dialog.title(title)
+        dialog.configure(bg="#101820")
+        dialog.transient(self)  # stay on top of the main window
+        dialog.protocol("WM_DELETE_WINDOW", partial(self._hide_dialog, dialog))
+        self._dialogs[key] = dialog
+        return dialog
+
+    def _hide_dialog(self, dialog: tk.Toplevel) -> None:
+        dialog.withdraw()
+
     def open_sort_dialog(self) -> None:
         if not self.students:
             messagebox.showinfo("No Data", "No student records available to sort.")
             return
 
-        dialog = tk.Toplevel(self)
-        dialog.title("Sort Records")
-        dialog.configure(bg="#101820")
-        dialog.grab_set()
+        if self._reopen_dialog("sort"):
+            return
+        dialog = self._new_dialog("sort", "Sort Records")
+
+        def sort_and_close(descending: bool) -> None:
+            self.sort_records(descending)
+            self._hide_dialog(dialog)
 
         tk.Label(
             dialog,
@@ -362,7 +464,7 @@ class StudentManagerApp(tk.Tk):
             text="Ascending (Lowest → Highest)",
             font=("Segoe UI", 11, "bold"),
             width=28,
-            command=lambda: (self.sort_records(False), dialog.destroy()),
+            command=partial(sort_and_close, False),
             bg="#1F4287",
             fg="white",
             pady=8,
@@ -373,7 +475,7 @@ class StudentManagerApp(tk.Tk):
             text="Descending (Highest → Lowest)",
             font=("Segoe UI", 11, "bold"),
             width=28,
-            command=lambda: (self.sort_records(True), dialog.destroy()),
+            command=partial(sort_and_close, True),
             bg="#1F4287",
             fg="white",
             pady=8,
@@ -382,23 +484,26 @@ class StudentManagerApp(tk.Tk):
     # Sort students by their overall score
     # can sort ascending (low to high) or descending (high to low)
     def sort_records(self, descending: bool) -> None:
-        ordered = sorted(
-            self.students, key=lambda s: s.overall_total, reverse=descending
-        )
+        # clicking sort again without changing anything reuses the last sort
+        ordered = self._sorted_cache.get(descending)
+        if ordered is None:
+            ordered = self._sorted_cache[descending] = sorted(
+                self.students, key=attrgetter("overall_total"), reverse=descending
+            )
         order_text = "descending" if descending else "ascending"
-        parts = [
-            f"Records sorted in {order_text} order by total score.\n"
-        ]
         # show each student with their rank
-        for idx, student in enumerate(ordered, start=1):
-            parts.append(f"Rank {idx}\n{format_record(student)}")
-        self.show_message("\n".join(parts))
+        ranking = "\n".join(
+            f"Rank {idx}\n{format_record(student)}"
+            for idx, student in enumerate(ordered, start=1)
+        )
+        self.show_message(
+            f"Records sorted in {order_text} order by total score.\n\n{ranking}"
+        )
 
     def open_add_dialog(self) -> None:
-        dialog = tk.Toplevel(self)
-        dialog.title("Add Student")
-        dialog.configure(bg="#101820")
-        dialog.grab_set()
+        if self._reopen_dialog("add"):
+            return
+        dialog = self._new_dialog("add", "Add Student")
 
         fields = [
             ("Student ID", "id"),
@@ -418,26 +523,31 @@ class StudentManagerApp(tk.Tk):
             entry.grid(row=idx, column=1, padx=10, pady=4)
             entries[key] = entry
 
+        def reset():
+            for entry in entries.values():
+                entry.delete(0, tk.END)
+
+        dialog.reset = reset
+
         def submit():
             try:
                 student_id = int(entries["id"].get())
-                name = entries["name"].get().strip()
-                coursework = [
-                    int(entries["cw1"].get()),
-                    int(entries["cw2"].get()),
-                    int(entries["cw3"].get()),
-                ]
-                exam = int(entries["exam"].get())
+                coursework, exam = parse_marks(entries)
             except ValueError:
                 messagebox.showerror("Invalid Input", "All numeric fields must be valid integers.")
                 return
+            name = entries["name"].get().strip()
+
+            if not marks_in_range(coursework, exam):
+                messagebox.showerror("Invalid Input", "Coursework marks must be 0-20 and the exam 0-100.")
+                return
 
             if not name:
                 messagebox.showerror("Invalid Input", "Student name cannot be empty.")
                 return
 
-            # check if ID already exists
-            if any(s.student_id == student_id for s in self.students):
+            # check if ID already exists (one dict lookup instead of scanning everyone)
+            if student_id in self._by_id:
                 messagebox.showerror("Duplicate ID", "A student with this ID already exists.")
                 return
 
@@ -449,9 +559,9 @@ class StudentManagerApp(tk.Tk):
                 exam_mark=exam,
             )
             self.students.append(new_record)
-            self.persist_and_refresh("Student added")  # save to file
             self.show_message(f"New student added successfully.\n\n{format_record(new_record)}")
-            dialog.destroy()
+            self.persist_and_refresh("Student added")  # save to file
+            self._hide_dialog(dialog)
 
         tk.Button(
             dialog,
@@ -464,10 +574,9 @@ class StudentManagerApp(tk.Tk):
         ).grid(row=len(fields), column=0, columnspan=2, pady=12)
 
     def open_delete_dialog(self) -> None:
-        dialog = tk.Toplevel(self)
-        dialog.title("Delete Student")
-        dialog.configure(bg="#101820")
-        dialog.grab_set()
+        if self._reopen_dialog("delete"):
+            return
+        dialog = self._new_dialog("delete", "Delete Student")
 
         tk.Label(
             dialog,
@@ -479,10 +588,11 @@ class StudentManagerApp(tk.Tk):
 
         entry = tk.Entry(dialog, font=("Segoe UI", 11), width=30)
         entry.pack(padx=10, pady=5)
+        dialog.reset = partial(entry.delete, 0, tk.END)
 
         def delete_record():
             query = entry.get().strip()
-            student = find_student(self.students, query)
+            student = self.find_student(query)
             if not student:
                 messagebox.showwarning("Not Found", "No matching student found.")
                 return
@@ -493,11 +603,11 @@ class StudentManagerApp(tk.Tk):
             ):
                 return
 
-            # remove student from list (keep all except the one to delete)
-            self.students = [s for s in self.students if s.student_id != student.student_id]
-            self.persist_and_refresh("Student removed")
+            # remove that student from the list in place (keeps everyone else in order)
+            self.students.remove(student)
             self.show_message(f"Record removed:\n\n{format_record(student)}")
-            dialog.destroy()
+            self.persist_and_refresh("Student removed")
+            self._hide_dialog(dialog)
 
         tk.Button(
             dialog,
@@ -510,10 +620,9 @@ class StudentManagerApp(tk.Tk):
         ).pack(pady=10)
 
     def open_update_dialog(self) -> None:
-        dialog = tk.Toplevel(self)
-        dialog.title("Update Student")
-        dialog.configure(bg="#101820")
-        dialog.grab_set()
+        if self._reopen_dialog("update"):
+            return
+        dialog = self._new_dialog("update", "Update Student")
 
         tk.Label(
             dialog,
@@ -532,17 +641,18 @@ class StudentManagerApp(tk.Tk):
         entry_widgets = {}
 
         def populate_fields(student: StudentRecord):
-            entry_widgets["name"].delete(0, tk.END)
-            entry_widgets["name"].insert(0, student.name)
-            for idx in range(3):
-                field = f"cw{idx+1}"
-                entry_widgets[field].delete(0, tk.END)
-                entry_widgets[field].insert(0, str(student.coursework_marks[idx]))
-            entry_widgets["exam"].delete(0, tk.END)
-            entry_widgets["exam"].insert(0, str(student.exam_mark))
+            cw1, cw2, cw3 = student.coursework_marks
+            values = (
+                ("name", student.name), ("cw1", cw1), ("cw2", cw2), ("cw3", cw3),
+                ("exam", student.exam_mark),
+            )
+            for key, value in values:
+                entry = entry_widgets[key]
+                entry.delete(0, tk.END)
+                entry.insert(0, str(value))
 
         def load_student():
-            student = find_student(self.students, search_var.get())
+            student = self.find_student(search_var.get())
             if not student:
                 messagebox.showwarning("Not Found", "Student not found.")
                 return
@@ -576,32 +686,45 @@ class StudentManagerApp(tk.Tk):
 
         dialog.selected_student = None
 
+        def reset():
+            search_var.set("")
+            for entry in entry_widgets.values():
+                entry.delete(0, tk.END)
+            dialog.selected_student = None
+
+        dialog.reset = reset
+
         def save_updates():
             student = getattr(dialog, "selected_student", None)
             if student is None:
                 messagebox.showinfo("Load Required", "Load a student before saving.")
                 return
+            # without a grab the list can change while this dialog is open
+            if self._by_id.get(student.student_id) is not student:
+                messagebox.showinfo("Record Changed", "That student was changed or removed, load them again.")
+                dialog.selected_student = None
+                return
             try:
-                new_name = entry_widgets["name"].get().strip()
-                coursework = [
-                    int(entry_widgets["cw1"].get()),
-                    int(entry_widgets["cw2"].get()),
-                    int(entry_widgets["cw3"].get()),
-                ]
-                exam = int(entry_widgets["exam"].get())
+                coursework, exam = parse_marks(entry_widgets)
             except ValueError:
                 messagebox.showerror("Invalid Input", "Marks must be valid integers.")
                 return
+            new_name = entry_widgets["name"].get().strip()
+            if not marks_in_range(coursework, exam):
+                messagebox.showerror("Invalid Input", "Coursework marks must be 0-20 and the exam 0-100.")
+                return
             if not new_name:
                 messagebox.showerror("Invalid Input", "Name cannot be empty.")
                 return
 
-            student.name = new_name
-            student.coursework_marks = coursework
-            student.exam_mark = exam
+            # records are frozen, so swap in an updated copy (totals get recalculated)
+            updated = replace(
+                student, name=new_name, coursework_marks=coursework, exam_mark=exam
+            )
+            self.students[self.students.index(student)] = updated
+            self.show_message(f"Record updated successfully.\n\n{format_record(updated)}")
             self.persist_and_refresh("Student updated")
-            self.show_message(f"Record updated successfully.\n\n{format_record(student)}")
-            dialog.destroy()
+            self._hide_dialog(dialog)
 
         tk.Button(
             dialog,
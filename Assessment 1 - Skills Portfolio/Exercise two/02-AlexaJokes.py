@@ -2,6 +2,7 @@
 # This app tells jokes from a file and can speak them out loud
 # Added voice feature cause it makes it more fun
 
+import queue
 import random
 import threading
 import tkinter as tk
@@ -24,21 +25,19 @@ def load_jokes():
     """Load jokes as (setup, punchline) tuples."""
     jokes = []
     try:
-        with JOKES_PATH.open(encoding="utf-8") as handle:
-            for raw_line in handle:
-                line = raw_line.strip()
-                # skip empty lines or lines without a question mark
-                if not line or "?" not in line:
-                    continue
-                # split at the question mark to get setup and punchline
-                setup, punchline = line.split("?", 1)
-                setup = setup.strip()
-                punchline = punchline.strip()
-                # only add if both parts exist
-                if setup and punchline:
-                    jokes.append((setup + "?", punchline))
+        text = JOKES_PATH.read_text(encoding="utf-8")
     except FileNotFoundError:
-        pass  # if file doesnt exist just return empty list
+        return jokes  # if file doesnt exist just return empty list
+
+    for line in text.splitlines():
+        # split at the first question mark to get setup and punchline
+        # (partition gives an empty separator when there isnt one, so no separate "?" check)
+        setup, question_mark, punchline = line.partition("?")
+        setup = setup.strip()
+        punchline = punchline.strip()
+        # only add if both parts exist (skips empty lines and lines without a question mark)
+        if question_mark and setup and punchline:
+            jokes.append((setup + "?", punchline))
     return jokes
 
 
@@ -51,37 +50,82 @@ class JokeAssistant(tk.Tk):
         self.geometry("640x420")
         self.configure(bg="#0A1F33")
 
-        self.jokes = load_jokes()
+        self.jokes = ()  # filled in by the loader thread
         self.current_joke = None
         self.voice_supported = False
         self.voice_ready = False
         self.voice_rate = 170
-        self.voice_message = ""
-
-        self._init_voice()
+        self.voice_message = "Starting voice assistant..."
+        self._speech_queue = None  # made in _init_voice if pyttsx3 is installed
+        self._jokes_loaded = threading.Event()
+        self._voice_started = threading.Event()
 
         self._build_ui()
 
+        # the joke file and the speech engine load in the background
+        # so the window shows up straight away instead of waiting on them
+        threading.Thread(target=self._load_jokes_in_background, daemon=True).start()
+        self._init_voice()
+        self.after(50, self._check_background_loading)
+
+    def _load_jokes_in_background(self):
+        """Read the jokes file off the UI thread."""
+        # stored as a tuple - the jokes never change once loaded, and the speech
+        # thread can never see the list halfway through being changed
+        self.jokes = tuple(load_jokes())
+        self._jokes_loaded.set()
+
+    # tk should only be touched from the main thread, so instead of the
+    # background threads updating the label this checks on them every 100ms
+    def _check_background_loading(self):
+        """Refresh the status line until the jokes and the voice have both loaded."""
+        self.status_label.config(text=self._status_text())
+        if not (self._jokes_loaded.is_set() and self._voice_started.is_set()):
+            self.after(100, self._check_background_loading)
+
     # Try to set up text to speech
     # had some issues getting this working at first but figured it out
     def _init_voice(self):
         """Prepare text-to-speech engine if pyttsx3 is available."""
         if pyttsx3 is None:
             self.voice_message = "Install pyttsx3 for voice playback."
+            self._voice_started.set()
             return
 
+        # one speech thread owns the engine for the whole app - making a new engine
+        # for every line was slow, and sharing one engine between threads was buggy
+        self._speech_queue = queue.Queue()
+        threading.Thread(target=self._speech_loop, daemon=True).start()
+
+    def _speech_loop(self):
+        """Create the engine once, then speak queued messages in order until told to stop."""
         try:
             engine = pyttsx3.init()
             engine.setProperty("rate", self.voice_rate)  # how fast it talks
-            engine.stop()
-            self.voice_supported = True
-            self.voice_ready = True
-            self.voice_message = "Voice assistant ready."
         except Exception:
             # if something goes wrong just disable voice
-            self.voice_supported = False
-            self.voice_ready = False
+            # and drop anything that got queued while the engine was starting
+            speech_queue, self._speech_queue = self._speech_queue, None
             self.voice_message = "Voice unavailable (initialisation failed)."
+            self._clear_speech_queue(speech_queue)
+            self._voice_started.set()
+            return
+
+        self.voice_supported = True
+        self.voice_ready = True
+        self.voice_message = "Voice assistant ready."
+        self._voice_started.set()
+
+        while True:
+            message = self._speech_queue.get()
+            if message is None:  # app is closing
+                break
+            try:
+                engine.say(message)
+                engine.runAndWait()  # wait for it to finish speaking
+            except Exception:
+                pass  # if it fails just ignore it
+        engine.stop()
 
     def _build_ui(self):
         header = tk.Label(
@@ -182,13 +226,19 @@ class JokeAssistant(tk.Tk):
         self.status_label.pack(pady=(10, 0))
 
     def _status_text(self):
-        jokes_text = (
-            f"Loaded {len(self.jokes)} jokes." if self.jokes else "No jokes available."
-        )
+        if not self._jokes_loaded.is_set():
+            jokes_text = "Loading jokes..."
+        elif self.jokes:
+            jokes_text = f"Loaded {len(self.jokes)} jokes."
+        else:
+            jokes_text = "No jokes available."
         return f"{jokes_text} {self.voice_message}"
 
     # Pick a random joke and show the setup
     def deliver_joke(self):
+        if not self._jokes_loaded.is_set():
+            self.setup_label.config(text="Hang on, still loading the jokes...")
+            return
         if not self.jokes:
             self.setup_label.config(text="Oops! I couldn't find any jokes.")
             self.punchline_label.config(text="")
@@ -201,6 +251,10 @@ class JokeAssistant(tk.Tk):
         self.setup_label.config(text=setup)
         self.punchline_label.config(text="(Tap 'Show Punchline' to reveal)")
         self.punchline_btn.config(state=tk.NORMAL)  # enable the button
+        # lines from older jokes that havent been said yet would just lag behind the screen
+        speech_queue = self._speech_queue
+        if speech_queue is not None:
+            self._clear_speech_queue(speech_queue)
         self.speak_text(setup)  # say it out loud if voice is enabled
 
     def reveal_punchline(self):
@@ -211,28 +265,31 @@ class JokeAssistant(tk.Tk):
             self.speak_text(punchline)
 
     # Speak the text using text to speech
-    # using threading so the UI doesnt freeze while talking
+    # the speech thread does the talking so the UI doesnt freeze
     def speak_text(self, text):
         """Speak text asynchronously if voice support is available."""
-        if not self.voice_supported or not text:
+        # queued even while the engine is still starting up, the speech thread
+        # says it once the engine is ready (or drops it if the engine fails)
+        speech_queue = self._speech_queue
+        if speech_queue is None or not text:
             return
+        speech_queue.put(text)
 
-        # worker function that runs in a separate thread
-        def _worker(message, rate):
-            try:
-                # create new engine each time cause reusing it was buggy
-                engine = pyttsx3.init()
-                engine.setProperty("rate", rate)
-                engine.say(message)
-                engine.runAndWait()  # wait for it to finish speaking
-                engine.stop()
-            except Exception:
-                pass  # if it fails just ignore it
-
-        # start the speech in a background thread
-        threading.Thread(
-            target=_worker, args=(text, self.voice_rate), daemon=True
-        ).start()
+    @staticmethod
+    def _clear_speech_queue(speech_queue):
+        """Throw away queued lines that havent been spoken yet."""
+        try:
+            while True:
+                speech_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def destroy(self):
+        """Close the window and let the speech thread shut its engine down."""
+        speech_queue = self._speech_queue
+        if speech_queue is not None:
+            speech_queue.put(None)
+        super().destroy()
 
 
 if __name__ == "__main__":